@@ -52,6 +52,10 @@ class Config(BaseModel):
     """Pilmoji 表情 CDN"""
     parser_emoji_style: EmojiStyle = EmojiStyle.FACEBOOK
     """Pilmoji 表情样式"""
+    parser_img_max_edge: int = 1920
+    """抖音/小红书图片转 JPG 时的最大边长, 超出则等比缩小, 0 表示不缩放"""
+    parser_img_quality: int = 90
+    """抖音/小红书图片转 JPG 的质量"""
     send_media_card: bool = False  
     """是否发送媒体卡片"""
     parser_enable_reaction: bool = False
@@ -156,6 +160,16 @@ class Config(BaseModel):
         """Pilmoji 表情样式"""
         return self.parser_emoji_style
 
+    @property
+    def img_max_edge(self) -> int:
+        """图片转 JPG 时的最大边长"""
+        return self.parser_img_max_edge
+
+    @property
+    def img_quality(self) -> int:
+        """图片转 JPG 的质量"""
+        return self.parser_img_quality
+
 
 
 pconfig: Config = get_plugin_config(Config)
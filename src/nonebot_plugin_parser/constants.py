@@ -1,7 +1,8 @@
+from ssl import SSLContext
 from enum import Enum
 from typing import Final
 
-from httpx import Timeout
+from httpx import Timeout, create_ssl_context
 
 COMMON_HEADER: Final[dict[str, str]] = {
     "User-Agent": (
@@ -28,6 +29,9 @@ COMMON_TIMEOUT: Final[Timeout] = Timeout(connect=15.0, read=20.0, write=10.0, po
 
 DOWNLOAD_TIMEOUT: Final[Timeout] = Timeout(connect=15.0, read=240.0, write=10.0, pool=10.0)
 
+SSL_CONTEXT: Final[SSLContext] = create_ssl_context()
+"""共享的 SSL 上下文, 校验证书, 避免每个客户端重复加载 CA"""
+
 
 class PlatformEnum(str, Enum):
     ACFUN = "acfun"
@@ -1,4 +1,7 @@
+import os
 import asyncio
+import hashlib
+from uuid import uuid4
 from pathlib import Path
 
 import aiofiles
@@ -174,6 +177,38 @@ class StreamDownloader:
             img_name = generate_file_name(url, ".jpg")
         return await self.streamd(url, file_name=img_name, ext_headers=ext_headers)
 
+    async def save_img(
+        self,
+        data: bytes,
+        *,
+        img_name: str | None = None,
+    ) -> Path:
+        """save image bytes to cache dir
+
+        Args:
+            data (bytes): image bytes
+            img_name (str | None): image name. Defaults to generate from content hash.
+
+        Returns:
+            Path: image file path
+        """
+        if img_name is None:
+            img_name = f"{hashlib.md5(data).hexdigest()[:16]}.jpg"
+        file_path = self.cache_dir / img_name
+        # 相同内容的图片已存在，直接返回
+        if file_path.exists():
+            return file_path
+
+        # 先写入临时文件再替换, 避免并发保存相同内容时返回未写完的文件
+        tmp_path = file_path.with_name(f"{file_path.name}.{uuid4().hex}.tmp")
+        try:
+            async with aiofiles.open(tmp_path, "wb") as file:
+                await file.write(data)
+            os.replace(tmp_path, file_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return file_path
+
     async def download_imgs_without_raise(
         self,
         urls: list[str],
@@ -1,5 +1,6 @@
+import sys
 from typing import Any, TypeVar, ParamSpec
-from asyncio import Task, create_task
+from asyncio import Task, create_task, get_running_loop
 from functools import wraps
 from collections.abc import Callable, Coroutine
 
@@ -17,3 +18,13 @@ def auto_task(func: Callable[P, Coroutine[Any, Any, T]]) -> Callable[P, Task[T]]
         return create_task(coro, name=func.__name__ + " | " + name)
 
     return wrapper
+
+
+def eager_task(coro: Coroutine[Any, Any, T]) -> Task[T]:
+    """创建 Task, Python 3.12+ 下立即执行协程直到首次挂起, 省去一次事件循环调度
+
+    仅作用于当前 Task, 不修改全局 task factory, 以免影响其他插件
+    """
+    if sys.version_info >= (3, 12):
+        return Task(coro, loop=get_running_loop(), eager_start=True)
+    return create_task(coro)
@@ -3,15 +3,18 @@
 from re import Match, Pattern, compile
 from abc import ABC
 from typing import TYPE_CHECKING, Any, TypeVar, ClassVar, cast
-from asyncio import Task
+from asyncio import Task, Semaphore, wait, gather, shield
 from pathlib import Path
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Sequence, Coroutine
 from typing_extensions import Unpack
 
+from nonebot import logger
+
 from .data import Platform, ParseResult, ParseResultKwargs
+from ..utils import LimitedSizeDict, fetch_bytes, transcode_to_jpg
 from ..config import pconfig as pconfig
 from ..download import DOWNLOADER as DOWNLOADER
-from ..constants import IOS_HEADER, COMMON_HEADER, ANDROID_HEADER, COMMON_TIMEOUT
+from ..constants import IOS_HEADER, SSL_CONTEXT, COMMON_HEADER, ANDROID_HEADER, COMMON_TIMEOUT
 from ..constants import PlatformEnum as PlatformEnum
 from ..exception import TipException as TipException
 from ..exception import ParseException as ParseException
@@ -19,6 +22,10 @@ from ..exception import DownloadException as DownloadException
 from ..exception import ZeroSizeException as ZeroSizeException
 from ..exception import SizeLimitException as SizeLimitException
 from ..exception import DurationLimitException as DurationLimitException
+from ..download.task import eager_task
+
+if TYPE_CHECKING:
+    from httpx import AsyncClient
 
 T = TypeVar("T", bound="BaseParser")
 HandlerFunc = Callable[[T, Match[str]], Coroutine[Any, Any, ParseResult]]
@@ -26,6 +33,21 @@ KeyPatterns = list[tuple[str, Pattern[str]]]
 
 _KEY_PATTERNS = "_key_patterns"
 
+_IMG_CONCURRENCY = 8
+""" 单次解析中并发下载图片的上限, 避免同时向同一 CDN 发起过多请求 """
+
+_JPG_CACHE: LimitedSizeDict[str, Task[Path | None]] = LimitedSizeDict(max_size=256)
+""" 图片 URL -> 转换并保存 JPG 的 Task, 同一 URL 只下载转换一次, 并合并进行中的请求 """
+
+_BACKGROUND_TASKS: set[Task[None]] = set()
+""" 持有后台关闭客户端的 Task 引用, 防止被垃圾回收 """
+
+
+async def _aclose_after(client: "AsyncClient", tasks: list[Task[Any]]) -> None:
+    """等待 tasks 全部结束后关闭客户端"""
+    await wait(tasks)
+    await client.aclose()
+
 
 # 注册处理器装饰器
 def handle(keyword: str, pattern: str):
@@ -210,17 +232,98 @@ class BaseParser:
 
     def create_image_contents(
         self,
-        image_urls: list[str],
+        image_sources: Sequence[str | Path],
     ):
-        """创建图片内容列表"""
+        """创建图片内容列表, 支持 URL 或本地图片路径"""
         from .data import ImageContent
 
         contents: list[ImageContent] = []
-        for url in image_urls:
-            task = DOWNLOADER.download_img(url, ext_headers=self.headers)
-            contents.append(ImageContent(task))
+        for source in image_sources:
+            # 已保存到本地的图片直接使用路径, 无需再创建 Task
+            path_task = DOWNLOADER.download_img(source, ext_headers=self.headers) if isinstance(source, str) else source
+            contents.append(ImageContent(path_task))
         return contents
 
+    async def _transcode_image_urls(
+        self,
+        image_urls: list[str],
+        label: str,
+        headers: dict[str, str] | None = None,
+    ) -> list[str | Path]:
+        """并发下载图片并转换为 JPG 保存到缓存目录, 转换失败的回退为原始 URL
+
+        Args:
+            image_urls: 图片 URL 列表
+            label: 日志标签
+            headers: 下载图片使用的请求头, 默认为 self.headers
+
+        Returns:
+            list[str | Path]: 与 image_urls 顺序一致的 JPG 路径或原始 URL
+        """
+        from httpx import Limits, AsyncClient
+
+        logger.info(f"[{label}] 发现{len(image_urls)}张图片，开始转换...")
+        semaphore = Semaphore(_IMG_CONCURRENCY)
+        owned: list[Task[Path | None]] = []
+
+        async def convert(url: str) -> Path | None:
+            try:
+                async with semaphore:
+                    raw = await fetch_bytes(client, url, pconfig.max_size)
+                jpg_data = await transcode_to_jpg(
+                    raw,
+                    max_edge=pconfig.img_max_edge,
+                    quality=pconfig.img_quality,
+                )
+                logger.debug(f"[{label}] 转换 {url[:60]}... {len(jpg_data)} bytes")
+                return await DOWNLOADER.save_img(jpg_data)
+            except Exception as e:
+                logger.warning(f"[{label}] 转换失败 {url[:60]}... {e}")
+                return None
+
+        def cached_convert(url: str) -> Task[Path | None]:
+            task = _JPG_CACHE.get(url)
+            # 缓存目录可能已被定时清理, 文件不存在时重新转换
+            if task is not None and task.done() and not task.cancelled():
+                path = task.result()
+                if path is None or not path.exists():
+                    task = None
+            if task is None or task.cancelled():
+                task = _JPG_CACHE[url] = eager_task(convert(url))
+                owned.append(task)
+            else:
+                _JPG_CACHE.move_to_end(url)
+            return task
+
+        # 共用一个客户端复用连接, gather 保持顺序
+        client = AsyncClient(
+            headers=headers or self.headers,
+            timeout=self.timeout,
+            verify=SSL_CONTEXT,
+            limits=Limits(max_keepalive_connections=_IMG_CONCURRENCY, max_connections=_IMG_CONCURRENCY),
+        )
+        try:
+            tasks = [cached_convert(url) for url in image_urls]
+            # Task 可能被其他调用共享, shield 避免当前调用被取消时连带取消
+            results = await gather(*[shield(task) for task in tasks])
+        finally:
+            # 被取消时本次创建的 Task 可能仍在使用客户端, 待其结束后再关闭
+            if pending := [task for task in owned if not task.done()]:
+                closer = eager_task(_aclose_after(client, pending))
+                _BACKGROUND_TASKS.add(closer)
+                closer.add_done_callback(_BACKGROUND_TASKS.discard)
+            else:
+                await client.aclose()
+
+        # 转换失败的不缓存, 下次重试; 仅移除自己等待的 Task, 避免误删其他调用新建的
+        for task, path, url in zip(tasks, results, image_urls):
+            if path is None and _JPG_CACHE.get(url) is task:
+                _JPG_CACHE.pop(url)
+
+        success_count = sum(1 for path in results if path)
+        logger.info(f"[{label}] 转换成功: {success_count}/{len(image_urls)}")
+        return [path or url for path, url in zip(results, image_urls)]
+
     def create_dynamic_contents(
         self,
         dynamic_urls: list[str],
@@ -1,19 +1,23 @@
 import re
-import json
-import asyncio
-from io import BytesIO
-from typing import Any, ClassVar
-from PIL import Image
+from typing import Any, TypeVar, ClassVar
 from httpx import Cookies, AsyncClient
-from msgspec import Struct, field, convert
+from msgspec import Raw, Struct, DecodeError, field
+from msgspec.json import decode
 from nonebot import logger
-import tempfile
-from pathlib import Path
 
 # 使用绝对导入
-from nonebot_plugin_parser.parsers.base import Platform, BaseParser, PlatformEnum, ParseException, handle
-from nonebot_plugin_parser.parsers.data import ImageContent
-from nonebot_plugin_parser.download import DOWNLOADER
+from nonebot_plugin_parser.parsers.base import (
+    SSL_CONTEXT,
+    Platform,
+    BaseParser,
+    PlatformEnum,
+    ParseException,
+    handle,
+)
+
+S = TypeVar("S", bound=Struct)
+
+_INITIAL_STATE_RE = re.compile(rb"window\.__INITIAL_STATE__=(.*?)</script>", re.DOTALL)
 
 
 class XiaoHongShuParser(BaseParser):
@@ -69,110 +73,26 @@ class XiaoHongShuParser(BaseParser):
             logger.debug("parse_explore failed, fallback to parse_discovery")
             return await self.parse_discovery(f"https://www.xiaohongshu.com/{route}")
 
-    async def _convert_webp_to_jpg(self, url: str, index: int = 0) -> tuple[int, bytes | None]:
-        """异步下载图片并转换为JPG字节数据"""
-        try:
-            async with AsyncClient(headers=self.headers, verify=False) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                # 打开图像
-                image = Image.open(BytesIO(response.content))
-
-                # 确保转换为RGB模式（JPG不支持透明度）
-                if image.mode != "RGB":
-                    image = image.convert("RGB")
-
-                # 转换为JPG字节数据
-                output = BytesIO()
-                image.save(output, format="JPEG", quality=95)
-                jpg_data = output.getvalue()
-
-                logger.debug(f"[小红书转换] 图片{index}: {url[:60]}... {len(jpg_data)} bytes")
-                return index, jpg_data
-
-        except Exception as e:
-            logger.warning(f"[小红书转换] 失败 图片{index}: {url[:60]}... {e}")
-            return index, None
-
-    async def _create_jpg_task(self, jpg_data: bytes) -> Path:
-        """将JPG字节数据保存到临时文件并返回路径"""
-        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as f:
-            f.write(jpg_data)
-            temp_path = Path(f.name)
-
-        if not hasattr(self, '_temp_files'):
-            self._temp_files = []
-        self._temp_files.append(temp_path)
-
-        logger.debug(f"[临时文件] 创建JPG文件: {temp_path}")
-        return temp_path
-
-    def create_image_contents(self, image_sources: list) -> list:
-        """创建图片内容，支持URL或JPG字节数据"""
-        contents = []
-        for source in image_sources:
-            if isinstance(source, bytes):
-                # 为JPG字节数据创建异步任务
-                task = asyncio.create_task(self._create_jpg_task(source))
-                contents.append(ImageContent(task))
-            elif isinstance(source, str):
-                # 为URL使用原有下载器
-                task = DOWNLOADER.download_img(source, ext_headers=self.headers)
-                contents.append(ImageContent(task))
-        return contents
-
     async def parse_explore(self, url: str, xhs_id: str):
         async with AsyncClient(
             headers=self.headers,
             timeout=self.timeout,
+            verify=SSL_CONTEXT,
         ) as client:
             response = await client.get(url)
-            html = response.text
             logger.debug(f"url: {response.url} | status_code: {response.status_code}")
 
-        json_obj = self._extract_initial_state_json(html)
+        state = self._extract_initial_state(response.content, ExploreState)
 
-        # ["note"]["noteDetailMap"][xhs_id]["note"]
-        note_data = json_obj.get("note", {}).get("noteDetailMap", {}).get(xhs_id, {}).get("note", {})
-        if not note_data:
+        # ["note"]["noteDetailMap"][xhs_id]["note"], 其他笔记保持 Raw 不解析
+        raw_item = state.note.noteDetailMap.get(xhs_id) if state.note else None
+        try:
+            note_detail = decode(raw_item, type=NoteDetailItem).note if raw_item else None
+        except DecodeError:
+            note_detail = None
+        if not note_detail:
             raise ParseException("can't find note detail in json_obj")
 
-        class Image(Struct):
-            urlDefault: str
-
-        class User(Struct):
-            nickname: str
-            avatar: str
-
-        class NoteDetail(Struct):
-            type: str
-            title: str
-            desc: str
-            user: User
-            imageList: list[Image] = field(default_factory=list)
-            video: Video | None = None
-
-            @property
-            def nickname(self) -> str:
-                return self.user.nickname
-
-            @property
-            def avatar_url(self) -> str:
-                return self.user.avatar
-
-            @property
-            def image_urls(self) -> list[str]:
-                return [item.urlDefault for item in self.imageList]
-
-            @property
-            def video_url(self) -> str | None:
-                if self.type != "video" or not self.video:
-                    return None
-                return self.video.video_url
-
-        note_detail = convert(note_data, type=NoteDetail)
-
         contents = []
         # 添加视频内容
         if video_url := note_detail.video_url:
@@ -182,27 +102,7 @@ class XiaoHongShuParser(BaseParser):
 
         # 添加图片内容
         elif image_urls := note_detail.image_urls:
-            logger.info(f"[小红书解析] 发现{len(image_urls)}张图片，开始转换...")
-
-            # 并发转换所有图片
-            convert_tasks = [
-                self._convert_webp_to_jpg(img_url, i)
-                for i, img_url in enumerate(image_urls)
-            ]
-            results = await asyncio.gather(*convert_tasks)
-            results.sort(key=lambda x: x[0])
-
-            image_sources = []
-            success_count = 0
-
-            for idx, jpg_data in results:
-                if jpg_data:
-                    image_sources.append(jpg_data)
-                    success_count += 1
-                else:
-                    image_sources.append(image_urls[idx])
-
-            logger.info(f"[小红书解析] 转换成功: {success_count}/{len(image_urls)}")
+            image_sources = await self._transcode_image_urls(image_urls, "小红书解析")
             contents.extend(self.create_image_contents(image_sources))
 
         # 构建作者
@@ -222,87 +122,26 @@ class XiaoHongShuParser(BaseParser):
             follow_redirects=True,
             cookies=Cookies(),
             trust_env=False,
+            verify=SSL_CONTEXT,
         ) as client:
             response = await client.get(url)
-            html = response.text
 
-        json_obj = self._extract_initial_state_json(html)
-        note_data = json_obj.get("noteData")
-        if not note_data:
+        state = self._extract_initial_state(response.content, DiscoveryState)
+        if not state.noteData:
             raise ParseException("can't find noteData in json_obj")
-        preload_data = note_data.get("normalNotePreloadData", {})
-        note_data = note_data.get("data", {}).get("noteData", {})
+        preload_data = state.noteData.normalNotePreloadData
+        note_data = state.noteData.data.noteData
         if not note_data:
             raise ParseException("can't find noteData in noteData.data")
 
-        class Image(Struct):
-            url: str
-            urlSizeLarge: str | None = None
-
-        class User(Struct):
-            nickName: str
-            avatar: str
-
-        class NoteData(Struct):
-            type: str
-            title: str
-            desc: str
-            user: User
-            time: int
-            lastUpdateTime: int
-            imageList: list[Image] = []  # 有水印
-            video: Video | None = None
-
-            @property
-            def image_urls(self) -> list[str]:
-                return [item.url for item in self.imageList]
-
-            @property
-            def video_url(self) -> str | None:
-                if self.type != "video" or not self.video:
-                    return None
-                return self.video.video_url
-
-        class NormalNotePreloadData(Struct):
-            title: str
-            desc: str
-            imagesList: list[Image] = []  # 无水印, 但只有一只，用于视频封面
-
-            @property
-            def image_urls(self) -> list[str]:
-                return [item.urlSizeLarge or item.url for item in self.imagesList]
-
-        note_data = convert(note_data, type=NoteData)
-
         contents = []
         if video_url := note_data.video_url:
+            img_urls = note_data.image_urls
             if preload_data:
-                preload_data = convert(preload_data, type=NormalNotePreloadData)
-                img_urls = preload_data.image_urls
-            else:
-                img_urls = note_data.image_urls
+                img_urls = preload_data.image_urls or img_urls
             contents.append(self.create_video_content(video_url, img_urls[0]))
         elif img_urls := note_data.image_urls:
-            logger.info(f"[小红书解析] 发现{len(img_urls)}张图片，开始转换...")
-
-            convert_tasks = [
-                self._convert_webp_to_jpg(img_url, i)
-                for i, img_url in enumerate(img_urls)
-            ]
-            results = await asyncio.gather(*convert_tasks)
-            results.sort(key=lambda x: x[0])
-
-            image_sources = []
-            success_count = 0
-
-            for idx, jpg_data in results:
-                if jpg_data:
-                    image_sources.append(jpg_data)
-                    success_count += 1
-                else:
-                    image_sources.append(img_urls[idx])
-
-            logger.info(f"[小红书解析] 转换成功: {success_count}/{len(img_urls)}")
+            image_sources = await self._transcode_image_urls(img_urls, "小红书解析")
             contents.extend(self.create_image_contents(image_sources))
 
         return self.result(
@@ -313,14 +152,16 @@ class XiaoHongShuParser(BaseParser):
             timestamp=note_data.time // 1000,
         )
 
-    def _extract_initial_state_json(self, html: str) -> dict[str, Any]:
-        pattern = r"window\.__INITIAL_STATE__=(.*?)</script>"
-        matched = re.search(pattern, html)
+    def _extract_initial_state(self, html: bytes, state_type: type[S]) -> S:
+        matched = _INITIAL_STATE_RE.search(html)
         if not matched:
             raise ParseException("小红书分享链接失效或内容已删除")
 
-        json_str = matched.group(1).replace("undefined", "null")
-        return json.loads(json_str)
+        json_bytes = matched.group(1).replace(b"undefined", b"null")
+        try:
+            return decode(json_bytes, type=state_type)
+        except DecodeError as e:
+            raise ParseException(f"__INITIAL_STATE__ 解析失败: {e}")
 
 
 class Stream(Struct):
@@ -351,3 +192,109 @@ class Video(Struct):
         elif stream.h266:
             return stream.h266[0]["masterUrl"]
         return None
+
+
+class ExploreImage(Struct):
+    urlDefault: str
+
+
+class ExploreUser(Struct):
+    nickname: str
+    avatar: str
+
+
+class NoteDetail(Struct):
+    type: str
+    title: str
+    desc: str
+    user: ExploreUser
+    imageList: list[ExploreImage] = field(default_factory=list)
+    video: Video | None = None
+
+    @property
+    def nickname(self) -> str:
+        return self.user.nickname
+
+    @property
+    def avatar_url(self) -> str:
+        return self.user.avatar
+
+    @property
+    def image_urls(self) -> list[str]:
+        return [item.urlDefault for item in self.imageList]
+
+    @property
+    def video_url(self) -> str | None:
+        if self.type != "video" or not self.video:
+            return None
+        return self.video.video_url
+
+
+class NoteDetailItem(Struct):
+    note: NoteDetail | None = None
+
+
+class NoteState(Struct):
+    noteDetailMap: dict[str, Raw] = field(default_factory=dict)
+
+
+class ExploreState(Struct):
+    """explore 页面 __INITIAL_STATE__"""
+
+    note: NoteState | None = None
+
+
+class DiscoveryImage(Struct):
+    url: str
+    urlSizeLarge: str | None = None
+
+
+class DiscoveryUser(Struct):
+    nickName: str
+    avatar: str
+
+
+class NoteData(Struct):
+    type: str
+    title: str
+    desc: str
+    user: DiscoveryUser
+    time: int
+    lastUpdateTime: int
+    imageList: list[DiscoveryImage] = []  # 有水印
+    video: Video | None = None
+
+    @property
+    def image_urls(self) -> list[str]:
+        return [item.url for item in self.imageList]
+
+    @property
+    def video_url(self) -> str | None:
+        if self.type != "video" or not self.video:
+            return None
+        return self.video.video_url
+
+
+class NormalNotePreloadData(Struct):
+    title: str = ""
+    desc: str = ""
+    imagesList: list[DiscoveryImage] = []  # 无水印, 但只有一只，用于视频封面
+
+    @property
+    def image_urls(self) -> list[str]:
+        return [item.urlSizeLarge or item.url for item in self.imagesList]
+
+
+class DiscoveryData(Struct):
+    noteData: NoteData | None = None
+
+
+class DiscoveryNoteData(Struct):
+    data: DiscoveryData = field(default_factory=DiscoveryData)
+    normalNotePreloadData: NormalNotePreloadData | None = None  # 仅视频笔记使用
+
+
+class DiscoveryState(Struct):
+    """discovery 页面 __INITIAL_STATE__"""
+
+    noteData: DiscoveryNoteData | None = None
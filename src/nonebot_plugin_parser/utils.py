@@ -1,14 +1,23 @@
+import os
 import re
 import asyncio
 import hashlib
 import importlib.util
-from typing import Any, TypeVar
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, TypeVar
 from pathlib import Path
 from collections import OrderedDict
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
 
+from PIL import Image
 from nonebot import logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from httpx import AsyncClient
+
 K = TypeVar("K")
 V = TypeVar("V")
 
@@ -177,6 +186,116 @@ async def encode_video_to_h264(video_path: Path) -> Path:
     return output_path
 
 
+_turbo_encode: "Callable[[Image.Image, int], bytes] | None" = None
+""" libjpeg-turbo 编码函数, 未安装 turbojpeg 可选依赖或 libturbojpeg 时为 None """
+
+try:
+    import numpy as np  # pyright: ignore[reportMissingImports]
+    from turbojpeg import TJPF_RGB, TurboJPEG  # pyright: ignore[reportMissingImports]
+
+    _turbo_jpeg = TurboJPEG()
+
+    def _encode_with_turbo(image: Image.Image, quality: int) -> bytes:
+        return _turbo_jpeg.encode(np.asarray(image), quality=quality, pixel_format=TJPF_RGB)
+
+    _turbo_encode = _encode_with_turbo
+except (ImportError, RuntimeError, OSError):
+    pass
+
+_TRANSCODE_POOL = ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 1),
+    thread_name_prefix="parser-transcode",
+)
+""" 图片转码线程池, Pillow 编解码时会释放 GIL """
+
+
+def _transcode_webp_bytes(raw: bytes, max_edge: int, quality: int) -> bytes:
+    """将图片字节数据(WebP 等)转码为 JPG 字节数据, 超出 max_edge 时等比缩小"""
+    image = Image.open(BytesIO(raw))
+
+    # 确保转换为RGB模式（JPG不支持透明度）
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    # 编码耗时与像素数成正比, 过大的图片先缩小
+    if max_edge > 0 and max(image.size) > max_edge:
+        image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+
+    if _turbo_encode is not None:
+        return _turbo_encode(image, quality)
+
+    output = BytesIO()
+    image.save(output, format="JPEG", quality=quality)
+    return output.getvalue()
+
+
+def is_jpeg(raw: bytes) -> bool:
+    """根据文件头判断是否为 JPG"""
+    return raw[:3] == b"\xff\xd8\xff"
+
+
+async def fetch_bytes(client: "AsyncClient", url: str, max_size: int) -> bytes:
+    """流式读取响应体, 超过大小限制时提前中断
+
+    Args:
+        client (AsyncClient): httpx 客户端
+        url (str): url
+        max_size (int): 最大大小, 单位 MB
+
+    Returns:
+        bytes: 响应体
+
+    Raises:
+        httpx.HTTPError: 请求失败时抛出
+        SizeLimitException: 超过大小限制时抛出
+        ZeroSizeException: 响应体为空时抛出
+    """
+    from .exception import ZeroSizeException, SizeLimitException
+
+    max_bytes = max_size * 1024 * 1024
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+        # Content-Length 可能缺失或不准确, 仅用于提前拒绝, 读取时仍按实际大小检查
+        if int(response.headers.get("Content-Length", 0)) > max_bytes:
+            raise SizeLimitException
+
+        chunks: list[bytes] = []
+        total = 0
+        async for chunk in response.aiter_bytes():
+            total += len(chunk)
+            if total > max_bytes:
+                raise SizeLimitException
+            chunks.append(chunk)
+
+    if total == 0:
+        raise ZeroSizeException
+    # 单个分块时 join 直接返回该 bytes 对象, 后续 BytesIO 也不会拷贝
+    return b"".join(chunks)
+
+
+async def transcode_to_jpg(
+    raw: bytes,
+    *,
+    max_edge: int = 1920,
+    quality: int = 90,
+) -> bytes:
+    """在线程池中将图片转码为 JPG, 避免阻塞事件循环, 已是 JPG 则原样返回
+
+    Args:
+        raw (bytes): 原始图片字节数据
+        max_edge (int): 最大边长, 超出则等比缩小, 0 表示不缩放. Defaults to 1920.
+        quality (int): JPG 质量. Defaults to 90.
+
+    Returns:
+        bytes: JPG 字节数据
+    """
+    if is_jpeg(raw):
+        return raw
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_TRANSCODE_POOL, _transcode_webp_bytes, raw, max_edge, quality)
+
+
 def fmt_size(file_path: Path) -> str:
     """格式化文件大小
 
@@ -40,3 +40,16 @@ def test_limited_size_dict():
     for i in range(20, 30):
         limited_size_dict[f"test{i}"] = f"test{i}"
     assert len(limited_size_dict) == 20
+
+
+async def test_save_img_concurrent():
+    import os
+    import asyncio
+
+    from nonebot_plugin_parser.download import DOWNLOADER
+
+    data = os.urandom(1024 * 1024)
+    paths = await asyncio.gather(*[DOWNLOADER.save_img(data) for _ in range(8)])
+    assert len(set(paths)) == 1
+    assert paths[0].read_bytes() == data
+    assert not list(paths[0].parent.glob(f"{paths[0].name}.*.tmp"))
@@ -0,0 +1,98 @@
+import asyncio
+from io import BytesIO
+from uuid import uuid4
+from pathlib import Path
+
+import respx
+import pytest
+from httpx import Response
+
+
+def png_bytes() -> bytes:
+    from random import randint
+
+    from PIL import Image
+
+    output = BytesIO()
+    Image.new("RGB", (16, 16), (randint(0, 255), randint(0, 255), randint(0, 255))).save(output, format="PNG")
+    return output.getvalue()
+
+
+@pytest.fixture
+def parser():
+    from nonebot_plugin_parser.parsers import XiaoHongShuParser
+
+    return XiaoHongShuParser()
+
+
+@pytest.fixture
+def url() -> str:
+    # 每个测试使用不同的 URL, 避免共享模块级缓存
+    return f"https://example.com/{uuid4().hex}.png"
+
+
+@pytest.fixture
+def route(url: str):
+    with respx.mock:
+        yield respx.get(url).mock(return_value=Response(200, content=png_bytes()))
+
+
+async def test_transcode_coalesce(parser, url: str, route: respx.Route):
+    first, second = await asyncio.gather(
+        parser._transcode_image_urls([url, url], "test"),
+        parser._transcode_image_urls([url], "test"),
+    )
+    assert route.call_count == 1
+    assert isinstance(first[0], Path)
+    assert first[0].exists()
+    assert first == [first[0], first[0]]
+    assert second == [first[0]]
+
+
+async def test_transcode_failure_evicted(parser, url: str, route: respx.Route):
+    route.mock(side_effect=[Response(404), Response(200, content=png_bytes())])
+
+    # 失败时回退为原始 URL, 且不缓存
+    assert await parser._transcode_image_urls([url], "test") == [url]
+    result = await parser._transcode_image_urls([url], "test")
+    assert route.call_count == 2
+    assert isinstance(result[0], Path)
+    assert result[0].exists()
+
+
+async def test_transcode_stale_file(parser, url: str, route: respx.Route):
+    path = (await parser._transcode_image_urls([url], "test"))[0]
+    assert isinstance(path, Path)
+    path.unlink()
+
+    # 缓存文件被清理后重新转换
+    assert await parser._transcode_image_urls([url], "test") == [path]
+    assert route.call_count == 2
+    assert path.exists()
+
+
+async def test_transcode_cancel_isolated(parser, url: str, route: respx.Route):
+    started, release = asyncio.Event(), asyncio.Event()
+    content = png_bytes()
+
+    async def side_effect(request):
+        started.set()
+        await release.wait()
+        return Response(200, content=content)
+
+    route.mock(side_effect=side_effect)
+
+    first = asyncio.create_task(parser._transcode_image_urls([url], "test"))
+    await started.wait()
+    second = asyncio.create_task(parser._transcode_image_urls([url], "test"))
+    await asyncio.sleep(0)
+
+    # 取消先发起的调用不应影响共享同一 Task 的其他调用
+    first.cancel()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    result = await second
+    assert route.call_count == 1
+    assert isinstance(result[0], Path)
+    assert result[0].exists()
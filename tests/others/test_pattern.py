@@ -38,3 +38,32 @@ def test_pattern_matching():
         for url in failed_urls:
             logger.error(f"- {url}")
         pytest.fail(f"共有 {len(failed_urls)} 个 URL 未能匹配成功，请检查日志。")
+
+
+async def test_keyword_regex_rule():
+    from nonebot_plugin_alconna import UniMessage
+
+    from nonebot_plugin_parser.parsers import BaseParser
+    from nonebot_plugin_parser.matchers.rule import PSR_SEARCHED_KEY, KeyPatternList, KeywordRegexRule
+
+    key_patterns = [p for _cls in BaseParser.get_all_subclass() for p in _cls._key_patterns]
+    rule = KeywordRegexRule(KeyPatternList(*key_patterns))
+
+    # 长关键词优先: v.douyin 先于 douyin
+    state = {}
+    assert await rule(UniMessage.text("看看这个 https://v.douyin.com/_2ljF4AmKL8 哈哈"), state)
+    searched = state[PSR_SEARCHED_KEY]
+    assert searched.keyword == "v.douyin"
+    assert searched.searched.group(0) == "v.douyin.com/_2ljF4AmKL8"
+
+    # 不含关键词
+    state = {}
+    assert not await rule(UniMessage.text("今天天气不错"), state)
+    assert PSR_SEARCHED_KEY not in state
+
+    # 含关键词但正则不匹配
+    assert not await rule(UniMessage.text("douyin 真好玩"), state)
+    assert PSR_SEARCHED_KEY not in state
+
+    # 空消息
+    assert not await rule(UniMessage.text("   "), state)
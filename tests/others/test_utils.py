@@ -16,6 +16,94 @@ def test_keep_zh_en_num():
     assert keep_zh_en_num("12#¥%……*3ab#*#@c测#**@@试") == "123abc测试"
 
 
+async def test_transcode_to_jpg():
+    from io import BytesIO
+
+    from PIL import Image
+
+    from nonebot_plugin_parser.utils import is_jpeg, transcode_to_jpg
+
+    def encode(fmt: str, mode: str = "RGB") -> bytes:
+        output = BytesIO()
+        Image.new(mode, (16, 16)).save(output, format=fmt)
+        return output.getvalue()
+
+    jpg = encode("JPEG")
+    assert await transcode_to_jpg(jpg) is jpg
+
+    for raw in (encode("WEBP"), encode("PNG", "RGBA")):
+        assert not is_jpeg(raw)
+        assert is_jpeg(await transcode_to_jpg(raw))
+
+    output = BytesIO()
+    Image.new("RGB", (4000, 2000)).save(output, format="WEBP")
+    jpg = await transcode_to_jpg(output.getvalue(), max_edge=1000)
+    assert Image.open(BytesIO(jpg)).size == (1000, 500)
+
+
+def test_turbo_encode():
+    import pytest
+
+    pytest.importorskip("turbojpeg")
+
+    from io import BytesIO
+
+    from PIL import Image
+
+    from nonebot_plugin_parser.utils import is_jpeg, _turbo_encode
+
+    # 已安装 PyTurboJPEG 但缺少 libturbojpeg 时 _turbo_encode 为 None
+    if _turbo_encode is None:
+        pytest.skip("libturbojpeg 不可用")
+
+    jpg = _turbo_encode(Image.new("RGB", (32, 16), (255, 0, 0)), 90)
+    assert is_jpeg(jpg)
+    assert Image.open(BytesIO(jpg)).size == (32, 16)
+
+
+async def test_fetch_bytes():
+    import respx
+    import pytest
+    from httpx import Response, AsyncClient
+
+    from nonebot_plugin_parser.utils import fetch_bytes
+    from nonebot_plugin_parser.exception import ZeroSizeException, SizeLimitException
+
+    url = "https://example.com/img"
+    body = b"x" * 1024
+
+    async def chunked(data: bytes):
+        yield data
+
+    async with AsyncClient() as client:
+        with respx.mock:
+            route = respx.get(url)
+            # Content-Length 缺失
+            route.mock(return_value=Response(200, content=chunked(body)))
+            raw = await fetch_bytes(client, url, 1)
+            assert raw == body
+            assert type(raw) is bytes
+
+            # Content-Length 小于实际大小, 按实际读取
+            route.mock(return_value=Response(200, headers={"Content-Length": "1"}, content=body))
+            assert await fetch_bytes(client, url, 1) == body
+
+            # Content-Length 超过限制, 不读取响应体
+            too_large = str(2 * 1024 * 1024)
+            route.mock(return_value=Response(200, headers={"Content-Length": too_large}, content=body))
+            with pytest.raises(SizeLimitException):
+                await fetch_bytes(client, url, 1)
+
+            # Content-Length 缺失且实际超过限制
+            route.mock(return_value=Response(200, content=chunked(b"x" * (2 * 1024 * 1024))))
+            with pytest.raises(SizeLimitException):
+                await fetch_bytes(client, url, 1)
+
+            route.mock(return_value=Response(200, content=b""))
+            with pytest.raises(ZeroSizeException):
+                await fetch_bytes(client, url, 1)
+
+
 async def test_clean_plugin_cache():
     from nonebot_plugin_parser import clean_plugin_cache
 
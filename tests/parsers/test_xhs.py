@@ -31,3 +31,58 @@ async def test_parse():
             assert path.exists()
 
     await asyncio.gather(*[parse(url) for url in urls])
+
+
+def test_extract_initial_state():
+    """__INITIAL_STATE__ 离线解析测试"""
+    from msgspec.json import decode
+
+    from nonebot_plugin_parser.parsers import XiaoHongShuParser
+    from nonebot_plugin_parser.parsers.xiaohongshu import ExploreState, DiscoveryState, NoteDetailItem
+
+    parser = XiaoHongShuParser()
+
+    explore_html = (
+        b"<script>window.__INITIAL_STATE__="
+        b'{"global":{"appSettings":undefined},"note":{"noteDetailMap":{'
+        b'"abc":{"note":{"type":"normal","title":"title","desc":"desc",'
+        b'"user":{"nickname":"nick","avatar":"https://a.com/avatar"},'
+        b'"imageList":[{"urlDefault":"https://a.com/1"},{"urlDefault":"https://a.com/2"}]}},'
+        b'"other":{"note":undefined}}}}'
+        b"</script>"
+    )
+    state = parser._extract_initial_state(explore_html, ExploreState)
+    assert state.note
+    note = decode(state.note.noteDetailMap["abc"], type=NoteDetailItem).note
+    assert note
+    assert note.nickname == "nick"
+    assert note.image_urls == ["https://a.com/1", "https://a.com/2"]
+    assert note.video_url is None
+    assert decode(state.note.noteDetailMap["other"], type=NoteDetailItem).note is None
+
+    note_data = (
+        b'{"type":"video","title":"title","desc":"desc","time":1700000000000,"lastUpdateTime":1700000000000,'
+        b'"user":{"nickName":"nick","avatar":"https://a.com/avatar"},"imageList":[{"url":"https://a.com/wm"}],'
+        b'"video":{"media":{"stream":{"h264":[{"masterUrl":"https://a.com/264"}],'
+        b'"h265":[{"masterUrl":"https://a.com/265"}]}}}}'
+    )
+    preload_data = (
+        b'{"title":"title","desc":"desc","imagesList":[{"url":"https://a.com/1","urlSizeLarge":"https://a.com/large"}]}'
+    )
+    for preload, cover in ((preload_data, "https://a.com/large"), (b"undefined", None)):
+        discovery_html = (
+            b"<script>window.__INITIAL_STATE__="
+            b'{"noteData":{"data":{"noteData":' + note_data + b'},"normalNotePreloadData":' + preload + b"}}"
+            b"</script>"
+        )
+        state = parser._extract_initial_state(discovery_html, DiscoveryState)
+        assert state.noteData
+        assert state.noteData.data.noteData
+        assert state.noteData.data.noteData.video_url == "https://a.com/265"
+        assert state.noteData.data.noteData.image_urls == ["https://a.com/wm"]
+        preload_state = state.noteData.normalNotePreloadData
+        if cover:
+            assert preload_state
+            assert preload_state.image_urls == [cover]
+        else:
+            assert preload_state is None